@@ -313,6 +313,17 @@ def normalize_location_name(name):
     return name.replace(' ', '').lower()
 
 
+def odata_string_literal(value):
+    '''
+    Quote a value as an OData string literal, doubling any single quotes in it.
+    '''
+    return "'{0}'".format(value.replace("'", "''"))
+
+
+def app_id_filter(app_id):
+    return "appId eq {0}".format(odata_string_literal(app_id))
+
+
 # FUTURE: either get this from the requirements file (if we can be sure it's always available at runtime)
 # or generate the requirements files from this so we only have one source of truth to maintain...
 AZURE_PKG_VERSIONS = {
@@ -424,6 +435,7 @@ class AzureRMModuleBase(object):
         self._automation_client = None
         self._IoThub_client = None
         self._lock_client = None
+        self._parsed_tags = dict()
 
         self.check_mode = self.module.check_mode
         self.api_profile = self.module.params.get('api_profile')
@@ -477,6 +489,9 @@ class AzureRMModuleBase(object):
         self.module.deprecate(msg, version)
 
     def log(self, msg, pretty_print=False):
+        # module.debug() is a no-op without debug enabled, so skip the json dump too
+        if not self.module._debug:
+            return
         if pretty_print:
             self.module.debug(json.dumps(msg, indent=4, sort_keys=True))
         else:
@@ -539,20 +554,21 @@ class AzureRMModuleBase(object):
         if not tag_list:
             return True
 
-        matches = 0
-        result = False
-        for tag in tag_list:
-            tag_key = tag
-            tag_value = None
-            if ':' in tag:
-                tag_key, tag_value = tag.split(':')
-            if tag_value and obj_tags.get(tag_key) == tag_value:
-                matches += 1
-            elif not tag_value and obj_tags.get(tag_key):
-                matches += 1
-        if matches == len(tag_list):
-            result = True
-        return result
+        # fact modules call this once per listed object with the same tag list,
+        # so split the key:value pairs only once
+        cache_key = tuple(tag_list)
+        parsed_tags = self._parsed_tags.get(cache_key)
+        if parsed_tags is None:
+            parsed_tags = [tag.split(':', 1) if ':' in tag else (tag, None) for tag in tag_list]
+            self._parsed_tags[cache_key] = parsed_tags
+
+        for tag_name, tag_value in parsed_tags:
+            if tag_value:
+                if obj_tags.get(tag_name) != tag_value:
+                    return False
+            elif not obj_tags.get(tag_name):
+                return False
+        return True
 
     def get_resource_group(self, resource_group):
         '''
@@ -844,6 +860,8 @@ class AzureRMModuleBase(object):
         cred = self.azure_auth.azure_credentials
         base_url = self.azure_auth._cloud_environment.endpoints.active_directory_graph_resource_id
         client = GraphRbacManagementClient(cred, tenant_id, base_url)
+        # reuse the underlying requests session instead of reconnecting per call
+        client.config.keep_alive = True
 
         return client
 
@@ -896,6 +914,8 @@ class AzureRMModuleBase(object):
             client.models = types.MethodType(_ansible_get_models, client)
 
         client.config = self.add_user_agent(client.config)
+        # reuse the underlying requests session instead of reconnecting per call
+        client.config.keep_alive = True
 
         if self.azure_auth._cert_validation_mode == 'ignore':
             client.config.session_configuration_callback = self._validation_ignore_callback
@@ -41,6 +41,7 @@ class GenericRestClientConfiguration(AzureConfiguration):
         super(GenericRestClientConfiguration, self).__init__(base_url)
 
         self.add_user_agent(ANSIBLE_USER_AGENT)
+        self.keep_alive = True
 
         self.credentials = credentials
         self.subscription_id = subscription_id
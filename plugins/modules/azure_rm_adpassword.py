@@ -111,7 +111,7 @@ start_date:
 
 '''
 
-from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase, app_id_filter
 import uuid
 
 try:
@@ -157,7 +157,7 @@ class AzureRMADPassword(AzureRMModuleBase):
                                                 is_ad_resource=True)
 
     def exec_module(self, **kwargs):
-        for key in list(self.module_arg_spec.keys()):
+        for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
 
         self.client = self.get_graphrbac_client(self.tenant)
@@ -166,7 +166,7 @@ class AzureRMADPassword(AzureRMModuleBase):
 
         if self.state == 'present':
             if self.key_id and self.key_exists(passwords):
-                self.update(passwords)
+                self.update_password(passwords)
             else:
                 self.create_password(passwords)
         else:
@@ -178,10 +178,7 @@ class AzureRMADPassword(AzureRMModuleBase):
         return self.results
 
     def key_exists(self, old_passwords):
-        for pd in old_passwords:
-            if pd.key_id == self.key_id:
-                return True
-        return False
+        return any(pd.key_id == self.key_id for pd in old_passwords)
 
     def resolve_app_obj_id(self):
         try:
@@ -194,7 +191,7 @@ class AzureRMADPassword(AzureRMModuleBase):
                 if not self.app_id:
                     self.fail("can't resolve app via service principal object id {0}".format(self.service_principal_object_id))
 
-                result = list(self.client.applications.list(filter="appId eq '{0}'".format(self.app_id)))
+                result = list(self.client.applications.list(filter=app_id_filter(self.app_id)))
                 if result:
                     self.app_object_id = result[0].object_id
                 else:
@@ -228,17 +225,10 @@ class AzureRMADPassword(AzureRMModuleBase):
             self.results['changed'] = False
             return
 
-        num_of_passwords_before_delete = len(old_passwords)
-
-        for pd in old_passwords:
-            if pd.key_id == self.key_id:
-                old_passwords.remove(pd)
-                break
+        old_passwords.remove(next(pd for pd in old_passwords if pd.key_id == self.key_id))
         try:
             self.client.applications.patch(self.app_object_id, ApplicationUpdateParameters(password_credentials=old_passwords))
-            num_of_passwords_after_delete = len(self.get_all_passwords())
-            if num_of_passwords_after_delete != num_of_passwords_before_delete:
-                self.results['changed'] = True
+            self.results['changed'] = True
 
         except GraphErrorException as ge:
             self.fail("failed to delete password with key id {0} - {1}".format(self.app_id, str(ge)))
@@ -261,9 +251,8 @@ class AzureRMADPassword(AzureRMModuleBase):
         old_passwords.append(new_password)
 
         try:
-            client = self.get_graphrbac_client(self.tenant)
             app_patch_parameters = ApplicationUpdateParameters(password_credentials=old_passwords)
-            client.applications.patch(self.app_object_id, app_patch_parameters)
+            self.client.applications.patch(self.app_object_id, app_patch_parameters)
 
             new_passwords = self.get_all_passwords()
             for pd in new_passwords:
@@ -110,7 +110,7 @@ passwords:
 
 '''
 
-from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase, app_id_filter
 
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -153,7 +153,7 @@ class AzureRMADPasswordInfo(AzureRMModuleBase):
 
     def exec_module(self, **kwargs):
 
-        for key in list(self.module_arg_spec.keys()):
+        for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
 
         self.client = self.get_graphrbac_client(self.tenant)
@@ -174,12 +174,12 @@ class AzureRMADPasswordInfo(AzureRMModuleBase):
                 return
             elif self.app_id or self.service_principal_object_id:
                 if not self.app_id:
-                    sp = self.client.service_principals.get(self.service_principal_id)
+                    sp = self.client.service_principals.get(self.service_principal_object_id)
                     self.app_id = sp.app_id
                 if not self.app_id:
                     self.fail("can't resolve app via service principal object id {0}".format(self.service_principal_object_id))
 
-                result = list(self.client.applications.list(filter="appId eq '{0}'".format(self.app_id)))
+                result = list(self.client.applications.list(filter=app_id_filter(self.app_id)))
                 if result:
                     self.app_object_id = result[0].object_id
                 else:
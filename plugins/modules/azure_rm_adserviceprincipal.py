@@ -94,6 +94,7 @@ object_id:
 '''
 
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBaseExt
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import app_id_filter
 try:
     from azure.graphrbac.models import ServicePrincipalCreateParameters
     from azure.graphrbac.models import ServicePrincipalUpdateParameters
@@ -125,26 +126,43 @@ class AzureRMADServicePrincipal(AzureRMModuleBaseExt):
         self.object_id = None
         self.results = dict(changed=False)
 
+        self.client = None
+
         super(AzureRMADServicePrincipal, self).__init__(derived_arg_spec=self.module_arg_spec,
-                                                        supports_check_mode=False,
+                                                        supports_check_mode=True,
                                                         supports_tags=False,
                                                         is_ad_resource=True)
 
     def exec_module(self, **kwargs):
 
-        for key in list(self.module_arg_spec.keys()):
+        for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
 
+        self.client = self.get_graphrbac_client(self.tenant)
         response = self.get_resource()
 
         if response:
             if self.state == 'present':
-                if self.check_update(response):
-                    self.update_resource(response)
+                to_update = self.check_update(response)
+                if to_update:
+                    self.results['changed'] = True
+                    if self.check_mode:
+                        self.results.update(response)
+                        return self.results
+                    self.update_resource(response, to_update)
+                else:
+                    self.results.update(response)
             elif self.state == 'absent':
+                self.results['changed'] = True
+                if self.check_mode:
+                    self.results.update(response)
+                    return self.results
                 self.delete_resource(response)
         else:
             if self.state == 'present':
+                self.results['changed'] = True
+                if self.check_mode:
+                    return self.results
                 self.create_resource()
             elif self.state == 'absent':
                 self.log("try to delete non exist resource")
@@ -153,54 +171,49 @@ class AzureRMADServicePrincipal(AzureRMModuleBaseExt):
 
     def create_resource(self):
         try:
-            client = self.get_graphrbac_client(self.tenant)
-            response = client.service_principals.create(ServicePrincipalCreateParameters(app_id=self.app_id, account_enabled=True))
+            response = self.client.service_principals.create(ServicePrincipalCreateParameters(app_id=self.app_id, account_enabled=True))
             self.results['changed'] = True
             self.results.update(self.to_dict(response))
             return response
         except GraphErrorException as ge:
             self.fail("Error creating service principle, app id {0} - {1}".format(self.app_id, str(ge)))
 
-    def update_resource(self, old_response):
+    def update_resource(self, old_response, to_update):
         try:
-            client = self.get_graphrbac_client(self.tenant)
-            to_update = {}
-            if self.app_role_assignment_required is not None:
-                to_update['app_role_assignment_required'] = self.app_role_assignment_required
-
-            client.service_principals.update(old_response['object_id'], to_update)
+            self.client.service_principals.update(old_response['object_id'], to_update)
             self.results['changed'] = True
-            self.results.update(self.get_resource())
+            old_response.update(to_update)
+            self.results.update(old_response)
 
         except GraphErrorException as ge:
             self.fail("Error updating the service principal app_id {0} - {1}".format(self.app_id, str(ge)))
 
     def delete_resource(self, response):
         try:
-            client = self.get_graphrbac_client(self.tenant)
-            client.service_principals.delete(response.get('object_id'))
+            self.client.service_principals.delete(response.get('object_id'))
             self.results['changed'] = True
-            return True
+            self.results.update(response)
+            return response
         except GraphErrorException as ge:
             self.fail("Error deleting service principal app_id {0} - {1}".format(self.app_id, str(ge)))
 
     def get_resource(self):
         try:
-            client = self.get_graphrbac_client(self.tenant)
-            result = list(client.service_principals.list(filter="servicePrincipalNames/any(c:c eq '{0}')".format(self.app_id)))
+            result = next(iter(self.client.service_principals.list(filter=app_id_filter(self.app_id))), None)
             if not result:
                 return False
-            result = result[0]
             return self.to_dict(result)
         except GraphErrorException as ge:
             self.log("Did not find the graph instance instance {0} - {1}".format(self.app_id, str(ge)))
             return False
 
     def check_update(self, response):
-        app_assignment_changed = self.app_role_assignment_required is not None and \
-            self.app_role_assignment_required != response.get('app_role_assignment_required', None)
+        to_update = {}
+        if self.app_role_assignment_required is not None and \
+                self.app_role_assignment_required != response.get('app_role_assignment_required', None):
+            to_update['app_role_assignment_required'] = self.app_role_assignment_required
 
-        return app_assignment_changed
+        return to_update
 
     def to_dict(self, object):
         return dict(
@@ -84,6 +84,7 @@ object_id:
 '''
 
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBase
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import app_id_filter
 
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -114,17 +115,22 @@ class AzureRMADServicePrincipalInfo(AzureRMModuleBase):
 
     def exec_module(self, **kwargs):
 
-        for key in list(self.module_arg_spec.keys()):
+        for key in self.module_arg_spec:
             setattr(self, key, kwargs[key])
 
         service_principals = []
 
         try:
             client = self.get_graphrbac_client(self.tenant)
-            if self.object_id is None:
-                service_principals = list(client.service_principals.list(filter="servicePrincipalNames/any(c:c eq '{0}')".format(self.app_id)))
-            else:
-                service_principals = [client.service_principals.get(self.object_id)]
+            if self.object_id is not None:
+                try:
+                    service_principals = [client.service_principals.get(self.object_id)]
+                except GraphErrorException as ge:
+                    # an unknown object id is an empty result, not an error
+                    if ge.response is None or ge.response.status_code != 404:
+                        raise
+            elif self.app_id is not None:
+                service_principals = list(client.service_principals.list(filter=app_id_filter(self.app_id)))
 
             self.results['service_principals'] = [self.to_dict(sp) for sp in service_principals]
         except GraphErrorException as ge:
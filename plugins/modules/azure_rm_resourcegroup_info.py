@@ -135,7 +135,7 @@ except Exception:
     # This is handled in azure_rm_common
     pass
 
-from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase, odata_string_literal
 
 
 AZURE_OBJECT_CLASS = 'ResourceGroup'
@@ -205,7 +205,7 @@ class AzureRMResourceGroupInfo(AzureRMModuleBase):
     def list_items(self):
         self.log('List all items')
         try:
-            response = self.rm_client.resource_groups.list()
+            response = self.rm_client.resource_groups.list(filter=self.tag_filter())
         except CloudError as exc:
             self.fail("Failed to list all items - {0}".format(str(exc)))
 
@@ -215,6 +215,17 @@ class AzureRMResourceGroupInfo(AzureRMModuleBase):
                 results.append(self.serialize_obj(item, AZURE_OBJECT_CLASS))
         return results
 
+    def tag_filter(self):
+        # ARM can filter resource groups on a single tag, so push the first one
+        # to the server; has_tags still checks the full list client side
+        if not self.tags:
+            return None
+        tag_key, _, tag_value = self.tags[0].partition(':')
+        tag_filter = "tagName eq {0}".format(odata_string_literal(tag_key))
+        if tag_value:
+            tag_filter += " and tagValue eq {0}".format(odata_string_literal(tag_value))
+        return tag_filter
+
     def list_by_rg(self, name):
         self.log('List resources under resource group')
         results = []
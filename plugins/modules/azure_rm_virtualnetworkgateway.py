@@ -275,7 +275,6 @@ class AzureRMVirtualNetworkGateway(AzureRMModuleBase):
             self.location = resource_group.location
 
         self.virtual_network = self.parse_resource_to_dict(self.virtual_network)
-        resource_group = self.get_resource_group(self.resource_group)
 
         try:
             vgw = self.network_client.virtual_network_gateways.get(self.resource_group, self.name)